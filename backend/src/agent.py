@@ -7,16 +7,20 @@ Retro changes:
 - JSON export added: session data saved to ./sessions/<session_id>.json on summarize/stop.
 - Coffee break added: pause the show, order coffee, resume. Saves ./sessions/<session_id>_coffee.json
 """
-print("🔥 AGENT FILE LOADED:", __file__)
 
+import concurrent.futures
+import functools
 import json
 import logging
 import asyncio
-import uuid
+import secrets
 import random
+import re
 import os
+import time
+import types
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Dict, Optional, Annotated
 
 from dotenv import load_dotenv
@@ -33,8 +37,10 @@ from livekit.agents import (
     RunContext,
 )
 
-from livekit.plugins import murf, silero, google, deepgram, noise_cancellation
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
+try:
+    import orjson  # 2-5x faster dumps; optional, stdlib json is the fallback
+except ImportError:
+    orjson = None
 
 # -------------------------
 # Logging
@@ -47,10 +53,53 @@ logger.addHandler(handler)
 
 load_dotenv(".env.local")
 
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("AGENT FILE LOADED: %s", __file__)
+
+
+@functools.cache
+def _plugins():
+    """Import the heavy LiveKit plugins on first use.
+
+    Pulling these in at module import drags ONNX/torch machinery into every
+    process that merely imports agent (tests, tooling). Workers hit this once
+    in prewarm; __main__ triggers it eagerly so `download-files` still sees
+    every plugin registered.
+    """
+    from livekit.plugins import murf, silero, google, deepgram, noise_cancellation
+    from livekit.plugins.turn_detector.multilingual import MultilingualModel
+
+    return types.SimpleNamespace(
+        murf=murf,
+        silero=silero,
+        google=google,
+        deepgram=deepgram,
+        noise_cancellation=noise_cancellation,
+        MultilingualModel=MultilingualModel,
+    )
+
+
+_ts_cache = [0, ""]  # [epoch second, formatted string]
+
+
+def _now_iso() -> str:
+    """UTC timestamp in the Z-suffixed RFC3339 form used everywhere in this file.
+
+    Timestamps are second-precision, so the formatted string is cached per
+    epoch second — bursts of tool calls within one second skip the datetime
+    construction entirely.
+    """
+    s = int(time.time())
+    c = _ts_cache
+    if c[0] != s:
+        c[0] = s
+        c[1] = datetime.fromtimestamp(s, timezone.utc).isoformat().replace("+00:00", "Z")
+    return c[1]
+
 # -------------------------
 # Improv Scenarios (seeded)
 # -------------------------
-SCENARIOS = [
+SCENARIOS = (
     "You are a barista who has to tell a customer that their latte is actually a portal to another dimension.",
     "You are a time-travelling tour guide explaining modern smartphones to someone from the 1800s.",
     "You are a restaurant waiter who must calmly tell a customer that their order has escaped the kitchen.",
@@ -60,13 +109,16 @@ SCENARIOS = [
     "You are a nervous wedding officiant who keeps getting the couple's names mixed up in ridiculous ways.",
     "You are a ghost trying to give a performance review to a living employee.",
     "You are a medieval king reacting to a very modern delivery service showing up at court.",
-    "You are a detective interrogating a suspect who only answers in awkward metaphors."
-]
+    "You are a detective interrogating a suspect who only answers in awkward metaphors.",
+)
+_N_SCENARIOS = len(SCENARIOS)
 
 # -------------------------
 # Coffee Menu
 # -------------------------
-COFFEE_MENU = {
+# Read-only view: the menu is static reference data shared by every session,
+# so guard it against accidental per-session mutation.
+COFFEE_MENU = types.MappingProxyType({
     "espresso":       {"name": "Espresso",            "price": 2.50, "emoji": "☕"},
     "latte":          {"name": "Latte",                "price": 3.50, "emoji": "🥛"},
     "cappuccino":     {"name": "Cappuccino",           "price": 3.50, "emoji": "☕"},
@@ -77,13 +129,36 @@ COFFEE_MENU = {
     "hot chocolate":  {"name": "Hot Chocolate",        "price": 3.25, "emoji": "🍫"},
     "green tea":      {"name": "Green Tea",            "price": 2.75, "emoji": "🍵"},
     "chai latte":     {"name": "Chai Latte",           "price": 3.75, "emoji": "🍵"},
-}
+})
+
+# Built once at import so order_coffee can resolve an exact drink name with a
+# single dict lookup and only fall back to the substring scan for fuzzy input.
+_MENU_KEYS = tuple(COFFEE_MENU)
 
 # -------------------------
 # JSON Save Helpers
 # -------------------------
 SESSIONS_DIR = "sessions"
 
+def _dump_json(filepath: str, payload: Dict) -> None:
+    """Write pretty-printed UTF-8 JSON, via orjson when available."""
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+
+
+def _coffee_totals(breaks: List[Dict]) -> tuple:
+    """Total spend and drink count across all coffee breaks in one pass."""
+    total_spent = 0.0
+    total_drinks = 0
+    for b in breaks:
+        total_spent += b.get("total_price", 0)
+        total_drinks += len(b.get("orders", []))
+    return total_spent, total_drinks
+
 def _save_session_json(userdata: "Userdata") -> str:
     os.makedirs(SESSIONS_DIR, exist_ok=True)
     filepath = os.path.join(SESSIONS_DIR, f"{userdata.session_id}.json")
@@ -91,7 +166,7 @@ def _save_session_json(userdata: "Userdata") -> str:
         "session_id":   userdata.session_id,
         "player_name":  userdata.player_name,
         "started_at":   userdata.started_at,
-        "saved_at":     datetime.utcnow().isoformat() + "Z",
+        "saved_at":     _now_iso(),
         "improv_state": userdata.improv_state,
         "rounds": [
             {
@@ -105,12 +180,11 @@ def _save_session_json(userdata: "Userdata") -> str:
         "history": userdata.history,
     }
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
-        logger.info(f"📄 Session saved → {filepath}")
+        _dump_json(filepath, payload)
+        logger.info("📄 Session saved → %s", filepath)
         return filepath
     except Exception as e:
-        logger.error(f"Failed to save session JSON: {e}")
+        logger.error("Failed to save session JSON: %s", e)
         return f"(save failed: {e})"
 
 
@@ -120,13 +194,12 @@ def _save_coffee_json(userdata: "Userdata") -> str:
     filepath = os.path.join(SESSIONS_DIR, f"{userdata.session_id}_coffee.json")
 
     breaks = userdata.coffee_breaks
-    total_spent = sum(b.get("total_price", 0) for b in breaks)
-    total_drinks = sum(len(b.get("orders", [])) for b in breaks)
+    total_spent, total_drinks = _coffee_totals(breaks)
 
     payload = {
         "session_id":    userdata.session_id,
         "player_name":   userdata.player_name,
-        "saved_at":      datetime.utcnow().isoformat() + "Z",
+        "saved_at":      _now_iso(),
         "total_breaks":  len(breaks),
         "total_drinks":  total_drinks,
         "total_spent":   round(total_spent, 2),
@@ -134,30 +207,34 @@ def _save_coffee_json(userdata: "Userdata") -> str:
         "coffee_breaks": breaks,
     }
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
-        logger.info(f"☕ Coffee log saved → {filepath}")
+        _dump_json(filepath, payload)
+        logger.info("☕ Coffee log saved → %s", filepath)
         return filepath
     except Exception as e:
-        logger.error(f"Failed to save coffee JSON: {e}")
+        logger.error("Failed to save coffee JSON: %s", e)
         return f"(save failed: {e})"
 
 
 # -------------------------
 # Per-session Improv State
 # -------------------------
-@dataclass
-class Userdata:
-    player_name: Optional[str] = None
-    session_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    started_at: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
-    improv_state: Dict = field(default_factory=lambda: {
+def _new_improv_state() -> Dict:
+    """Fresh improv-state dict; the single source of truth for its shape."""
+    return {
         "current_round": 0,
         "max_rounds": 3,
         "rounds": [],
         "phase": "idle",
-        "used_indices": []
-    })
+        "deck": [],
+    }
+
+
+@dataclass
+class Userdata:
+    player_name: Optional[str] = None
+    session_id: str = field(default_factory=lambda: secrets.token_hex(4))
+    started_at: str = field(default_factory=_now_iso)
+    improv_state: Dict = field(default_factory=_new_improv_state)
     history: List[Dict] = field(default_factory=list)
     # ── Coffee break state ──────────────────────────────────────
     coffee_breaks: List[Dict] = field(default_factory=list)
@@ -168,36 +245,60 @@ class Userdata:
 # Helpers
 # -------------------------
 def _pick_scenario(userdata: Userdata) -> str:
-    used = userdata.improv_state.get("used_indices", [])
-    candidates = [i for i in range(len(SCENARIOS)) if i not in used]
-    if not candidates:
-        userdata.improv_state["used_indices"] = []
-        candidates = list(range(len(SCENARIOS)))
-    idx = random.choice(candidates)
-    userdata.improv_state["used_indices"].append(idx)
-    return SCENARIOS[idx]
+    # Shuffled-deck draw: shuffle once per cycle, then pop — O(1) per pick and
+    # no repeats until the deck is exhausted.
+    deck = userdata.improv_state.get("deck")
+    if not deck:
+        deck = list(range(_N_SCENARIOS))
+        random.shuffle(deck)
+        userdata.improv_state["deck"] = deck
+    scenario = SCENARIOS[deck.pop()]
+    # Remembered here so record_performance doesn't have to scan history.
+    userdata.improv_state["current_scenario"] = scenario
+    return scenario
+
+
+# One case-insensitive pass over the performance instead of a substring scan
+# per keyword; group names map straight to highlight phrases.
+_HL_RE = re.compile(
+    r"(?P<funny>funny|lol|haha)|(?P<sad>sad|cry|tears)|(?P<pause>pause|\.\.\.)",
+    re.IGNORECASE,
+)
+_HL_TEXT = {
+    "funny": "great comedic timing",
+    "sad":   "good emotional depth",
+    "pause": "interesting use of silence",
+}
+_FALLBACK_HIGHLIGHTS = ("nice character choices", "bold commitment", "unexpected twist")
+
+# Single pass over each performance for the end-of-show style profile,
+# replacing one substring scan per keyword per counter.
+_PROFILE_RE = re.compile(
+    r"(?P<char>\bi am\b|\bi'm\b|\bas a\b|character|role)"
+    r"|(?P<emo>sad|angry|happy|love|cry|tears)",
+    re.IGNORECASE,
+)
+
+
+# Reaction templates in tone order: supportive, neutral, mildly critical.
+_REACTION_TEMPLATES = (
+    "Neon MC: Love that — {0}! That was playful and clear. Nice work. Ready for the next beat?",
+    "Neon MC: Hmm — {0}. Interesting shapes in there; try leaning more into one choice. Next scene when you're ready.",
+    "Neon MC: Okay — {0}, but that felt a bit rushed. Push the choices louder next time. Let's level up.",
+)
 
 
 def _host_reaction_text(performance: str) -> str:
-    tones = ["supportive", "neutral", "mildly_critical"]
-    tone = random.choice(tones)
-    highlights = []
-    perf_l = (performance or "").lower()
-    if any(w in perf_l for w in ("funny", "lol", "hahaha", "haha")):
-        highlights.append("great comedic timing")
-    if any(w in perf_l for w in ("sad", "cry", "tears")):
-        highlights.append("good emotional depth")
-    if "pause" in perf_l or "..." in perf_l:
-        highlights.append("interesting use of silence")
+    seen = set()
+    for m in _HL_RE.finditer(performance or ""):
+        seen.add(m.lastgroup)
+        if len(seen) == len(_HL_TEXT):
+            break
+    highlights = [text for group, text in _HL_TEXT.items() if group in seen]
     if not highlights:
-        highlights.append(random.choice(["nice character choices", "bold commitment", "unexpected twist"]))
+        highlights.append(random.choice(_FALLBACK_HIGHLIGHTS))
     chosen = random.choice(highlights)
-    if tone == "supportive":
-        return f"Neon MC: Love that — {chosen}! That was playful and clear. Nice work. Ready for the next beat?"
-    elif tone == "neutral":
-        return f"Neon MC: Hmm — {chosen}. Interesting shapes in there; try leaning more into one choice. Next scene when you're ready."
-    else:
-        return f"Neon MC: Okay — {chosen}, but that felt a bit rushed. Push the choices louder next time. Let's level up."
+    return _REACTION_TEMPLATES[random.randrange(len(_REACTION_TEMPLATES))].format(chosen)
 
 
 def _menu_text() -> str:
@@ -208,6 +309,21 @@ def _menu_text() -> str:
     return "\n".join(lines)
 
 
+# The menu never changes at runtime, so render it once instead of on every
+# coffee_break tool call.
+_MENU_TEXT = _menu_text()
+
+
+# Static intro text assembled once; only player name and round count vary.
+_INTRO_TMPL = (
+    "*** Welcome to Improv Battle — Neon Arcade Edition! ***\n"
+    "I'm Neon MC, your synth-powered host.\n"
+    "{player}, we're running {rounds} rounds.\n"
+    "Rules: I'll flash a quick scene, you play it out. Say 'End scene' or pause when you're done — I'll react and move on. Keep it bold!\n"
+    "💡 Tip: Say 'coffee break' anytime to pause and grab a drink!"
+)
+
+
 # -------------------------
 # Agent Tools
 # -------------------------
@@ -224,26 +340,27 @@ async def start_show(
         userdata.player_name = userdata.player_name or "Contestant"
 
     max_rounds = max(1, min(int(max_rounds), 8))
-    userdata.improv_state["max_rounds"] = max_rounds
-    userdata.improv_state["current_round"] = 0
-    userdata.improv_state["rounds"] = []
-    userdata.improv_state["phase"] = "intro"
-    userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "start_show", "name": userdata.player_name})
-
-    intro = (
-        f"*** Welcome to Improv Battle — Neon Arcade Edition! ***\n"
-        f"I'm Neon MC, your synth-powered host.\n"
-        f"{userdata.player_name or 'Contestant'}, we're running {userdata.improv_state['max_rounds']} rounds.\n"
-        "Rules: I'll flash a quick scene, you play it out. Say 'End scene' or pause when you're done — I'll react and move on. Keep it bold!\n"
-        "💡 Tip: Say 'coffee break' anytime to pause and grab a drink!"
+    now = _now_iso()
+    state = userdata.improv_state
+    state["max_rounds"] = max_rounds
+    state["current_round"] = 0
+    state["rounds"] = []
+    state["phase"] = "intro"
+
+    intro = _INTRO_TMPL.format(
+        player=userdata.player_name or "Contestant",
+        rounds=max_rounds,
     )
 
     scenario = _pick_scenario(userdata)
-    userdata.improv_state["current_round"] = 1
-    userdata.improv_state["phase"] = "awaiting_improv"
-    userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "present_scenario", "round": 1, "scenario": scenario})
+    state["current_round"] = 1
+    state["phase"] = "awaiting_improv"
+    userdata.history.extend((
+        {"time": now, "action": "start_show", "name": userdata.player_name},
+        {"time": now, "action": "present_scenario", "round": 1, "scenario": scenario},
+    ))
 
-    return intro + "\n\nRound 1: " + scenario + "\n\nStart improvising now!"
+    return "\n\n".join((intro, f"Round 1: {scenario}", "Start improvising now!"))
 
 
 @function_tool
@@ -256,26 +373,28 @@ async def coffee_break(
     if userdata.active_coffee_break is not None:
         return "You're already on a coffee break! Order something or say 'done ordering' to resume."
 
-    if userdata.improv_state.get("phase") == "done":
+    state = userdata.improv_state
+    if state.get("phase") == "done":
         return "The show is over, but the coffee bar is always open! (No active session to resume.)"
 
     # Freeze current phase
-    userdata.improv_state["_phase_before_break"] = userdata.improv_state.get("phase", "idle")
-    userdata.improv_state["phase"] = "coffee_break"
+    state["_phase_before_break"] = state.get("phase", "idle")
+    state["phase"] = "coffee_break"
 
     # Open a new break record
+    now = _now_iso()
     userdata.active_coffee_break = {
-        "break_id":   str(uuid.uuid4())[:6],
-        "started_at": datetime.utcnow().isoformat() + "Z",
+        "break_id":   secrets.token_hex(3),
+        "started_at": now,
         "ended_at":   None,
         "orders":     [],
         "total_price": 0.0,
     }
-    userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "coffee_break_start"})
+    userdata.history.append({"time": now, "action": "coffee_break_start"})
 
     return (
         "⏸  Show paused — enjoy your break!\n\n"
-        + _menu_text()
+        + _MENU_TEXT
     )
 
 
@@ -294,12 +413,13 @@ async def order_coffee(
 
     drink_key = drink.strip().lower()
 
-    # Fuzzy match against menu keys
-    matched_key = None
-    for key in COFFEE_MENU:
-        if drink_key in key or key in drink_key:
-            matched_key = key
-            break
+    # Exact hit first (O(1)), then fuzzy match against menu keys
+    matched_key = drink_key if drink_key in COFFEE_MENU else None
+    if matched_key is None:
+        for key in _MENU_KEYS:
+            if drink_key in key or key in drink_key:
+                matched_key = key
+                break
 
     if not matched_key:
         menu_keys = ", ".join(COFFEE_MENU.keys())
@@ -315,7 +435,7 @@ async def order_coffee(
         "unit_price":     item["price"],
         "line_price":     line_price,
         "customization":  customization or "",
-        "ordered_at":     datetime.utcnow().isoformat() + "Z",
+        "ordered_at":     _now_iso(),
     }
 
     userdata.active_coffee_break["orders"].append(order_entry)
@@ -343,18 +463,20 @@ async def end_coffee_break(
 
     # Close the break
     break_record = userdata.active_coffee_break
-    break_record["ended_at"] = datetime.utcnow().isoformat() + "Z"
+    now = _now_iso()
+    break_record["ended_at"] = now
     userdata.coffee_breaks.append(break_record)
     userdata.active_coffee_break = None
 
     # Restore previous phase
-    prev_phase = userdata.improv_state.pop("_phase_before_break", "awaiting_improv")
-    userdata.improv_state["phase"] = prev_phase
+    state = userdata.improv_state
+    prev_phase = state.pop("_phase_before_break", "awaiting_improv")
+    state["phase"] = prev_phase
 
-    userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "coffee_break_end"})
+    userdata.history.append({"time": now, "action": "coffee_break_end"})
 
-    # Save coffee JSON immediately
-    coffee_filepath = _save_coffee_json(userdata)
+    # Save coffee JSON immediately (off the event loop — this is disk I/O)
+    coffee_filepath = await asyncio.to_thread(_save_coffee_json, userdata)
 
     orders = break_record.get("orders", [])
     if orders:
@@ -371,8 +493,8 @@ async def end_coffee_break(
         receipt = "No drinks ordered this break. Staying hydrated the old-fashioned way!\n"
 
     # Figure out what to say next
-    cur = userdata.improv_state.get("current_round", 0)
-    phase = userdata.improv_state.get("phase")
+    cur = state.get("current_round", 0)
+    phase = state["phase"]
 
     if phase == "awaiting_improv" and cur > 0:
         resume_msg = f"▶  Back to it! We're on Round {cur}. Pick up where you left off — go!"
@@ -387,22 +509,23 @@ async def end_coffee_break(
 @function_tool
 async def next_scenario(ctx: RunContext[Userdata]) -> str:
     userdata = ctx.userdata
-    if userdata.improv_state.get("phase") == "coffee_break":
+    state = userdata.improv_state
+    phase = state.get("phase")
+    if phase == "coffee_break":
         return "You're still on a coffee break! Say 'done ordering' to resume first."
-    if userdata.improv_state.get("phase") == "done":
+    if phase == "done":
         return "The show is already over. Say 'start show' to play again."
 
-    cur = userdata.improv_state.get("current_round", 0)
-    maxr = userdata.improv_state.get("max_rounds", 3)
-    if cur >= maxr:
-        userdata.improv_state["phase"] = "done"
+    cur = state.get("current_round", 0)
+    if cur >= state.get("max_rounds", 3):
+        state["phase"] = "done"
         return await summarize_show(ctx)
 
     next_round = cur + 1
     scenario = _pick_scenario(userdata)
-    userdata.improv_state["current_round"] = next_round
-    userdata.improv_state["phase"] = "awaiting_improv"
-    userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "present_scenario", "round": next_round, "scenario": scenario})
+    state["current_round"] = next_round
+    state["phase"] = "awaiting_improv"
+    userdata.history.append({"time": _now_iso(), "action": "present_scenario", "round": next_round, "scenario": scenario})
     return f"Round {next_round}: {scenario}\nGo!"
 
 
@@ -412,52 +535,70 @@ async def record_performance(
     performance: Annotated[str, Field(description="Player's improv performance (transcribed text)")],
 ) -> str:
     userdata = ctx.userdata
+    # Strip once at insert time so summarization does no per-round string work.
+    performance = (performance or "").strip()
 
-    if userdata.improv_state.get("phase") == "coffee_break":
+    state = userdata.improv_state
+    phase = state.get("phase")
+    if phase == "coffee_break":
         return "You're on a coffee break! Say 'done ordering' to resume before performing."
 
-    if userdata.improv_state.get("phase") != "awaiting_improv":
-        userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "record_performance_out_of_phase"})
+    if phase != "awaiting_improv":
+        userdata.history.append({"time": _now_iso(), "action": "record_performance_out_of_phase"})
 
-    round_no = userdata.improv_state.get("current_round", 0)
-    scenario = userdata.history[-1].get("scenario") if userdata.history and userdata.history[-1].get("action") == "present_scenario" else "(unknown)"
+    round_no = state.get("current_round", 0)
+    scenario = state.get("current_scenario", "(unknown)")
     reaction = _host_reaction_text(performance)
 
-    userdata.improv_state["rounds"].append({
+    state["rounds"].append({
         "round": round_no,
         "scenario": scenario,
         "performance": performance,
         "reaction": reaction,
     })
-    userdata.improv_state["phase"] = "reacting"
-    userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "record_performance", "round": round_no})
+    state["phase"] = "reacting"
+    is_final = round_no >= state.get("max_rounds", 3)
+    userdata.history.append({
+        "time": _now_iso(),
+        "action": "final_record_and_summary" if is_final else "record_performance",
+        "round": round_no,
+    })
 
-    if round_no >= userdata.improv_state.get("max_rounds", 3):
-        userdata.improv_state["phase"] = "done"
-        closing = "\n" + reaction + "\nThat's the final round. "
-        closing += (await summarize_show(ctx))
-        return closing
+    if is_final:
+        state["phase"] = "done"
+        summary = await _finalize_summary(userdata)
+        return "\n".join(("", reaction, f"That's the final round. {summary}"))
 
-    closing = reaction + "\nWhen you're ready, say 'Next' or I'll spin up the next scene."
-    return closing
+    return reaction + "\nWhen you're ready, say 'Next' or I'll spin up the next scene."
 
 
-@function_tool
-async def summarize_show(ctx: RunContext[Userdata]) -> str:
-    userdata = ctx.userdata
-    rounds = userdata.improv_state.get("rounds", [])
-    if not rounds:
-        return "No rounds were played. Thanks for dropping into Improv Battle!"
+async def _finalize_summary(userdata: Userdata) -> str:
+    """Build the end-of-show recap and persist the session files.
 
+    Does no history logging — each calling tool records its own entry, so the
+    closing path writes history exactly once however it is reached.
+    """
+    rounds = userdata.improv_state.get("rounds", [])
     summary_lines = [f"Thanks for playing, {userdata.player_name or 'Contestant'}! Here's your Neon Arcade recap:"]
     for r in rounds:
-        perf_snip = (r.get("performance") or "").strip()
+        perf_snip = r.get("performance") or ""
         if len(perf_snip) > 80:
             perf_snip = perf_snip[:77] + "..."
         summary_lines.append(f"Round {r.get('round')}: {r.get('scenario')} — You: '{perf_snip}' | Host: {r.get('reaction')}")
 
-    mentions_character = sum(1 for r in rounds if any(w in (r.get('performance') or '').lower() for w in ('i am', "i'm", 'as a', 'character', 'role')))
-    mentions_emotion = sum(1 for r in rounds if any(w in (r.get('performance') or '').lower() for w in ('sad', 'angry', 'happy', 'love', 'cry', 'tears')))
+    mentions_character = 0
+    mentions_emotion = 0
+    for r in rounds:
+        saw_char = saw_emo = False
+        for m in _PROFILE_RE.finditer(r.get("performance") or ""):
+            if m.lastgroup == "char":
+                saw_char = True
+            else:
+                saw_emo = True
+            if saw_char and saw_emo:
+                break
+        mentions_character += saw_char
+        mentions_emotion += saw_emo
 
     profile = "You seem like a player who "
     if mentions_character > len(rounds) / 2:
@@ -472,8 +613,7 @@ async def summarize_show(ctx: RunContext[Userdata]) -> str:
 
     # Coffee summary if any breaks taken
     if userdata.coffee_breaks:
-        total_drinks = sum(len(b.get("orders", [])) for b in userdata.coffee_breaks)
-        total_spent  = sum(b.get("total_price", 0) for b in userdata.coffee_breaks)
+        total_spent, total_drinks = _coffee_totals(userdata.coffee_breaks)
         summary_lines.append(
             f"☕ Coffee corner: {len(userdata.coffee_breaks)} break(s), "
             f"{total_drinks} drink(s), ${total_spent:.2f} total."
@@ -481,32 +621,40 @@ async def summarize_show(ctx: RunContext[Userdata]) -> str:
 
     summary_lines.append("Neon MC: Thanks for performing on Improv Battle — keep the synth alive!")
 
-    userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "summarize_show"})
-
-    # Save both JSONs
-    filepath = _save_session_json(userdata)
+    # Save both JSONs (off the event loop — these are disk I/O)
+    filepath = await asyncio.to_thread(_save_session_json, userdata)
     summary_lines.append(f"(Session saved → {filepath})")
 
     if userdata.coffee_breaks:
-        coffee_filepath = _save_coffee_json(userdata)
+        coffee_filepath = await asyncio.to_thread(_save_coffee_json, userdata)
         summary_lines.append(f"(Coffee log saved → {coffee_filepath})")
 
     return "\n".join(summary_lines)
 
 
+@function_tool
+async def summarize_show(ctx: RunContext[Userdata]) -> str:
+    userdata = ctx.userdata
+    if not userdata.improv_state.get("rounds"):
+        return "No rounds were played. Thanks for dropping into Improv Battle!"
+
+    userdata.history.append({"time": _now_iso(), "action": "summarize_show"})
+    return await _finalize_summary(userdata)
+
+
 @function_tool
 async def stop_show(ctx: RunContext[Userdata], confirm: Annotated[bool, Field(description="Confirm stop", default=False)] = False) -> str:
     userdata = ctx.userdata
     if not confirm:
         return "Are you sure you want to stop the show? Say 'stop show yes' to confirm."
     userdata.improv_state["phase"] = "done"
-    userdata.history.append({"time": datetime.utcnow().isoformat() + "Z", "action": "stop_show"})
+    userdata.history.append({"time": _now_iso(), "action": "stop_show"})
 
-    filepath = _save_session_json(userdata)
+    filepath = await asyncio.to_thread(_save_session_json, userdata)
     msg = f"Show stopped. Thanks for visiting Neon Arcade Improv Battle! (Session saved → {filepath})"
 
     if userdata.coffee_breaks:
-        coffee_filepath = _save_coffee_json(userdata)
+        coffee_filepath = await asyncio.to_thread(_save_coffee_json, userdata)
         msg += f"\n(Coffee log saved → {coffee_filepath})"
 
     return msg
@@ -515,73 +663,129 @@ async def stop_show(ctx: RunContext[Userdata], confirm: Annotated[bool, Field(de
 # -------------------------
 # The Agent (Improv Host)
 # -------------------------
+# Kept terse and flush-left: this string is resent as the system prompt on
+# every LLM turn, so indentation and filler are paid for in input tokens.
+_HOST_INSTRUCTIONS = """\
+You are the host of the TV improv show 'Improv Battle' — Neon Arcade Edition: a high-energy, witty synthwave MC guiding one contestant through short improv scenes.
+
+Rules:
+- Introduce the show with retro/arcade flavor, then present clear scenario prompts (who you are, what's happening, the tension).
+- Let the player improvise; on "End scene" or a finished utterance, call record_performance.
+- React after each scene in a varied, realistic way (supportive, neutral, mildly critical).
+- Run the configured rounds, then summarize the player's style.
+- Keep turns short and TTS-friendly.
+- "coffee break" / "I need a break" / "let's get coffee" → coffee_break tool.
+- A drink name → order_coffee tool.
+- "done ordering" / "that's all" / "resume" / "back to the show" → end_coffee_break tool.
+"""
+
+
+# Tool registry built once at import: GameMasterAgent is constructed per job,
+# and the tool list never changes between jobs.
+_HOST_TOOLS = [
+    start_show, next_scenario, record_performance,
+    summarize_show, stop_show,
+    coffee_break, order_coffee, end_coffee_break,   # ← NEW
+]
+
+
 class GameMasterAgent(Agent):
     def __init__(self):
-        instructions = """
-        You are the host of a TV improv show called 'Improv Battle' — Neon Arcade Edition.
-        Role: High-energy, witty synthwave MC. Guide a single contestant through short improv scenes.
-
-        Behavioural rules:
-            - Introduce the show and explain the rules at the start (use the retro/arcade flavor).
-            - Present clear scenario prompts (who you are, what's happening, what's the tension).
-            - Prompt the player to improvise and listen for "End scene" or accept an utterance passed to record_performance.
-            - After each scene, react in a varied, realistic way (supportive, neutral, mildly critical). Store the reaction.
-            - Run configured number of rounds, then summarize the player's style.
-            - Keep turns short and TTS-friendly.
-            - If the player says "coffee break", "I need a break", or "let's get coffee" → call coffee_break tool.
-            - If the player orders a drink by name → call order_coffee tool.
-            - If the player says "done ordering", "that's all", "resume" or "back to the show" → call end_coffee_break tool.
-        Use tools: start_show, next_scenario, record_performance, summarize_show, stop_show,
-                   coffee_break, order_coffee, end_coffee_break.
-        """
         super().__init__(
-            instructions=instructions,
-            tools=[
-                start_show, next_scenario, record_performance,
-                summarize_show, stop_show,
-                coffee_break, order_coffee, end_coffee_break,   # ← NEW
-            ],
+            instructions=_HOST_INSTRUCTIONS,
+            tools=_HOST_TOOLS,
         )
 
 
 # -------------------------
 # Entrypoint & Prewarm
 # -------------------------
+@functools.cache
+def _load_vad():
+    """Load Silero VAD once per interpreter; failures are not cached, so a
+    transient prewarm error can be retried at session start."""
+    return _plugins().silero.VAD.load()
+
+
 def prewarm(proc: JobProcess):
+    p = _plugins()
+    # Build the model clients once per job process: the turn detector loads
+    # ONNX weights and the STT/LLM/TTS plugins each open connection pools, so
+    # doing this per session would pay that cost on every job's first turn.
+    # VAD and turn-detector loads are independent disk/CPU work — run them in
+    # parallel so prewarm is gated by the slower of the two, not their sum.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        vad_future = pool.submit(_load_vad)
+        td_future = pool.submit(p.MultilingualModel)
+        try:
+            proc.userdata["vad"] = vad_future.result()
+        except Exception:
+            logger.warning("VAD prewarm failed; continuing without preloaded VAD.")
+        try:
+            proc.userdata["turn_detection"] = td_future.result()
+        except Exception:
+            logger.warning("Turn-detector prewarm failed; sessions will construct it on demand.")
     try:
-        proc.userdata["vad"] = silero.VAD.load()
+        proc.userdata["stt"] = p.deepgram.STT(model="nova-3")
+        proc.userdata["llm"] = p.google.LLM(model="gemini-2.5-flash")
+        proc.userdata["tts"] = p.murf.TTS(
+            voice="en-US-marcus",
+            style="Conversational",
+            text_pacing=True,
+        )
     except Exception:
-        logger.warning("VAD prewarm failed; continuing without preloaded VAD.")
+        logger.warning("Model prewarm failed; sessions will construct clients on demand.")
 
 
 async def entrypoint(ctx: JobContext):
     ctx.log_context_fields = {"room": ctx.room.name}
-    logger.info("\n" + "🎮" * 6)
-    logger.info("🚀 STARTING NEON ARCADE VOICE HOST — Improv Battle")
+    logger.info("Starting Neon Arcade voice host — Improv Battle")
 
     userdata = Userdata()
 
+    vad = ctx.proc.userdata.get("vad")
+    if vad is None:
+        # Prewarm may have hit a transient failure; retry once before running
+        # the whole session without VAD.
+        try:
+            vad = _load_vad()
+        except Exception:
+            logger.warning("VAD unavailable; session will run without it.")
+
+    p = _plugins()
+    pu = ctx.proc.userdata
     session = AgentSession(
-        stt=deepgram.STT(model="nova-3"),
-        llm=google.LLM(model="gemini-2.5-flash"),
-        tts=murf.TTS(
+        stt=pu.get("stt") or p.deepgram.STT(model="nova-3"),
+        llm=pu.get("llm") or p.google.LLM(model="gemini-2.5-flash"),
+        tts=pu.get("tts")
+        or p.murf.TTS(
             voice="en-US-marcus",
             style="Conversational",
             text_pacing=True,
         ),
-        turn_detection=MultilingualModel(),
-        vad=ctx.proc.userdata.get("vad"),
+        turn_detection=pu.get("turn_detection") or p.MultilingualModel(),
+        vad=vad,
         userdata=userdata,
     )
 
+    def _on_user_input_transcribed(ev):
+        # "End scene" is the explicit end-of-turn cue the host instructions
+        # already advertise — commit the turn as soon as it shows up in a
+        # partial transcript instead of waiting out the VAD silence window.
+        if not ev.is_final and ev.transcript.rstrip(" .!?").lower().endswith("end scene"):
+            session.commit_user_turn()
+
+    session.on("user_input_transcribed", _on_user_input_transcribed)
+
     await session.start(
         agent=GameMasterAgent(),
         room=ctx.room,
-        room_input_options=RoomInputOptions(noise_cancellation=noise_cancellation.BVC()),
+        room_input_options=RoomInputOptions(noise_cancellation=p.noise_cancellation.BVC()),
     )
 
     await ctx.connect()
 
 
 if __name__ == "__main__":
+    _plugins()  # register plugins up front so `download-files` can see them
     cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
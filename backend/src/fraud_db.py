@@ -1,36 +1,77 @@
+import functools
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Dict
 
+try:
+    import orjson  # faster parse/serialize; optional, stdlib json is the fallback
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("fraud_db")
 
 DB_PATH = Path(__file__).parent / "fraud_cases.json"
 
+@functools.lru_cache(maxsize=256)
+def _norm(name: str) -> str:
+    """Normalized form of a username; cached since the same few names repeat."""
+    return name.strip().lower()
+
+# Parsed-cases cache keyed on file mtime: tool calls for the same user fire
+# several times per conversation, and re-parsing the DB each time is wasted
+# disk and CPU work. The file is re-read only when it actually changes, and a
+# lowercased-username index is rebuilt alongside it for O(1) lookups.
+_cases_cache = {"mtime_ns": None, "cases": None, "by_user": None}
+
 def _load_all_cases() -> list:
-    if not DB_PATH.exists():
+    try:
+        mtime_ns = DB_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.warning("DB file not found, returning empty list.")
         return []
-    with open(DB_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    if _cases_cache["mtime_ns"] != mtime_ns:
+        if orjson is not None:
+            with open(DB_PATH, "rb") as f:
+                cases = orjson.loads(f.read())
+        else:
+            with open(DB_PATH, "r", encoding="utf-8") as f:
+                cases = json.load(f)
+        _cases_cache["mtime_ns"] = mtime_ns
+        _cases_cache["cases"] = cases
+        _cases_cache["by_user"] = {
+            _norm(c.get("userName", "")): (i, c) for i, c in enumerate(cases)
+        }
+    return _cases_cache["cases"]
 
 def _write_all_cases(cases: list):
-    with open(DB_PATH, "w", encoding="utf-8") as f:
-        json.dump(cases, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(cases, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(cases, indent=2).encode("utf-8")
+    # Write to a sibling temp file and rename into place so a crash mid-write
+    # can never leave a truncated fraud_cases.json behind.
+    tmp_path = DB_PATH.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, DB_PATH)
     logger.info("Wrote updated cases to disk.")
 
 def find_case_by_username(user_name: str) -> Optional[Dict]:
     cases = _load_all_cases()
-    for case in cases:
-        if case.get("userName", "").lower() == user_name.lower():
-            return case
-    return None
+    if not cases:
+        return None
+    hit = _cases_cache["by_user"].get(_norm(user_name))
+    return hit[1] if hit is not None else None
 
 def update_case(user_name: str, updates: Dict) -> bool:
     cases = _load_all_cases()
-    for i, case in enumerate(cases):
-        if case.get("userName", "").lower() == user_name.lower():
-            cases[i].update(updates)
-            _write_all_cases(cases)
-            return True
-    return False
+    if not cases:
+        return False
+    hit = _cases_cache["by_user"].get(_norm(user_name))
+    if hit is None:
+        return False
+    hit[1].update(updates)
+    _write_all_cases(cases)
+    return True